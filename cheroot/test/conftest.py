@@ -4,9 +4,6 @@ Contains fixtures, which are tightly bound to the Cheroot framework
 itself, useless for end-users' app testing.
 """
 
-import threading
-import time
-
 import pytest
 
 from .._compat import IS_MACOS, IS_WINDOWS  # noqa: WPS436
@@ -18,6 +15,7 @@ from ..testing import (  # noqa: F401  # pylint: disable=unused-import
     wsgi_server,
 )
 from ..testing import get_server_client
+from .helper import server_starter
 
 
 @pytest.fixture
@@ -60,50 +58,30 @@ def native_server_thread(thread_and_native_server):  # noqa: F811
 # pylint: disable=redefined-outer-name
 def wsgi_server_client(wsgi_server):  # noqa: F811
     """Create a test client out of given WSGI server."""
-    return get_server_client(wsgi_server)
+    test_client = get_server_client(wsgi_server)
+    yield test_client
+    test_client.close()
 
 
 @pytest.fixture
 # pylint: disable=redefined-outer-name
 def native_server_client(native_server):  # noqa: F811
     """Create a test client out of given HTTP server."""
-    return get_server_client(native_server)
+    test_client = get_server_client(native_server)
+    yield test_client
+    test_client.close()
 
 
 @pytest.fixture
 def http_server():
     """Provision a server creator as a fixture."""
-
-    def start_srv():
-        bind_addr = yield
-        if bind_addr is None:
-            return
-        httpserver = make_http_server(bind_addr)
-        yield httpserver
-        yield httpserver
-
-    srv_creator = iter(start_srv())
-    next(srv_creator)  # pylint: disable=stop-iteration-return
-    yield srv_creator
-    try:
-        while True:
-            httpserver = next(srv_creator)
-            if httpserver is not None:
-                httpserver.stop()
-    except StopIteration:
-        pass
+    with server_starter(make_http_server) as start_srv:
+        yield start_srv
 
 
 def make_http_server(bind_addr):
-    """Create and start an HTTP server bound to ``bind_addr``."""
-    httpserver = HTTPServer(
+    """Create an HTTP server bound to ``bind_addr``."""
+    return HTTPServer(
         bind_addr=bind_addr,
         gateway=Gateway,
     )
-
-    threading.Thread(target=httpserver.safe_start).start()
-
-    while not httpserver.ready:
-        time.sleep(0.1)
-
-    return httpserver
@@ -1,11 +1,10 @@
 """A library of helper functions for the Cheroot test suite."""
 
+import contextlib
 import datetime
 import logging
 import os
 import sys
-import time
-import threading
 import types
 import http.client
 
@@ -78,14 +77,13 @@ class CherootWebCase(webtest.WebCase):
     @classmethod
     def start(cls):
         """Load and start the HTTP server."""
-        threading.Thread(target=cls.httpserver.safe_start).start()
-        while not cls.httpserver.ready:
-            time.sleep(0.1)
+        cls._server_runner = contextlib.ExitStack()
+        cls._server_runner.enter_context(cls.httpserver._run_in_thread())
 
     @classmethod
     def stop(cls):
         """Terminate HTTP server."""
-        cls.httpserver.stop()
+        cls._server_runner.close()
         td = getattr(cls, "teardown", None)
         if td:
             td()
@@ -161,3 +159,19 @@ class Controller:
                         raise
         start_response(resp.status, resp.headers.items())
         return resp.output()
+
+
+@contextlib.contextmanager
+def server_starter(make_server):
+    """Provide a function starting the servers built by ``make_server``.
+
+    All of the servers it has started are stopped on exit.
+    """
+    with contextlib.ExitStack() as servers:
+
+        def start_srv(*args):
+            httpserver = make_server(*args)
+            servers.enter_context(httpserver._run_in_thread())
+            return httpserver
+
+        yield start_srv
@@ -127,7 +127,9 @@ class ErrorLogMonitor:
 
     def __call__(self, msg="", level=logging.INFO, traceback=False):
         """Intercept the call to the server error_log method."""
-        if traceback:
+        # Only messages above WARNING are reported with their traceback
+        # by the teardown verification, so don't format the rest.
+        if traceback and level > logging.WARNING:
             tblines = traceback_.format_exc()
         else:
             tblines = ""
@@ -23,6 +23,7 @@ from ..testing import (
     ANY_INTERFACE_IPV4,
     ANY_INTERFACE_IPV6,
     EPHEMERAL_PORT,
+    cheroot_server,
 )
 
 
@@ -201,7 +202,7 @@ def test_serving_is_false_and_stop_returns_after_ctrlc():
 )
 def test_bind_addr_inet(http_server, ip_addr):
     """Check that bound IP address is stored in server."""
-    httpserver = http_server.send((ip_addr, EPHEMERAL_PORT))
+    httpserver = http_server((ip_addr, EPHEMERAL_PORT))
 
     assert httpserver.bind_addr[0] == ip_addr
     assert httpserver.bind_addr[1] != EPHEMERAL_PORT
@@ -210,7 +211,7 @@ def test_bind_addr_inet(http_server, ip_addr):
 @unix_only_sock_test
 def test_bind_addr_unix(http_server, unix_sock_file):
     """Check that bound UNIX socket address is stored in server."""
-    httpserver = http_server.send(unix_sock_file)
+    httpserver = http_server(unix_sock_file)
 
     assert httpserver.bind_addr == unix_sock_file
 
@@ -218,11 +219,35 @@ def test_bind_addr_unix(http_server, unix_sock_file):
 @unix_only_sock_test
 def test_bind_addr_unix_abstract(http_server, unix_abstract_sock):
     """Check that bound UNIX abstract socket address is stored in server."""
-    httpserver = http_server.send(unix_abstract_sock)
+    httpserver = http_server(unix_abstract_sock)
 
     assert httpserver.bind_addr == unix_abstract_sock
 
 
+def test_cheroot_server_falls_back_to_ipv4(monkeypatch):
+    """Check that ``cheroot_server`` binds IPv4 if IPv6 is unavailable."""
+    orig_prepare = HTTPServer.prepare
+    abandoned_socks = []
+
+    def prepare_without_ipv6(httpserver):
+        if httpserver.bind_addr[0] != ANY_INTERFACE_IPV6:
+            return orig_prepare(httpserver)
+
+        # Simulate a failure after the socket has already been created
+        httpserver.socket = socket.socket()
+        abandoned_socks.append(httpserver.socket)
+        raise OSError("IPv6 is unavailable")
+
+    monkeypatch.setattr(HTTPServer, "prepare", prepare_without_ipv6)
+
+    with cheroot_server(HTTPServer) as (_server_thread, httpserver):
+        assert httpserver.ready
+        assert httpserver.bind_addr[0] == ANY_INTERFACE_IPV4
+
+    assert len(abandoned_socks) == 1
+    assert abandoned_socks[0].fileno() == -1  # closed
+
+
 PEERCRED_IDS_URI = "/peer_creds/ids"
 PEERCRED_TEXTS_URI = "/peer_creds/texts"
 
@@ -251,7 +276,7 @@ class _TestGateway(Gateway):
 @pytest.fixture
 def peercreds_enabled_server(http_server, unix_sock_file):
     """Construct a test server with ``peercreds_enabled``."""
-    httpserver = http_server.send(unix_sock_file)
+    httpserver = http_server(unix_sock_file)
     httpserver.gateway = _TestGateway
     httpserver.peercreds_enabled = True
     return httpserver
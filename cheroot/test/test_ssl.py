@@ -4,21 +4,18 @@ import functools
 import json
 import os
 import ssl
-import subprocess
 import sys
 import threading
-import time
 import traceback
 import http.client
 
-import OpenSSL.SSL
 import pytest
 import requests
 import trustme
 
-from .._compat import bton, ntob, ntou
+from .._compat import ntob, ntou
 from .._compat import IS_ABOVE_OPENSSL10, IS_CI, IS_PYPY
-from .._compat import IS_LINUX, IS_MACOS, IS_WINDOWS
+from .._compat import IS_LINUX, IS_MACOS, IS_WINDOWS, SYS_PLATFORM
 from ..server import HTTPServer, get_ssl_adapter_class
 from ..testing import (
     ANY_INTERFACE_IPV4,
@@ -29,29 +26,64 @@ from ..testing import (
     _probe_ipv6_sock,
 )
 from ..wsgi import Gateway_10
+from .helper import server_starter
 
 
 IS_GITHUB_ACTIONS_WORKFLOW = bool(os.getenv("GITHUB_WORKFLOW"))
-IS_WIN2016 = (
-    IS_WINDOWS
-    # pylint: disable=unsupported-membership-test
-    and b"Microsoft Windows Server 2016 Datacenter"
-    in subprocess.check_output(
-        ("systeminfo",),
-    )
-)
 IS_LIBRESSL_BACKEND = ssl.OPENSSL_VERSION.startswith("LibreSSL")
-IS_PYOPENSSL_SSL_VERSION_1_0 = OpenSSL.SSL.SSLeay_version(
-    OpenSSL.SSL.SSLEAY_VERSION
-).startswith(b"OpenSSL 1.0.")
 PY310_PLUS = sys.version_info[:2] >= (3, 10)
 
 
-_stdlib_to_openssl_verify = {
-    ssl.CERT_NONE: OpenSSL.SSL.VERIFY_NONE,
-    ssl.CERT_OPTIONAL: OpenSSL.SSL.VERIFY_PEER,
-    ssl.CERT_REQUIRED: OpenSSL.SSL.VERIFY_PEER
-    + OpenSSL.SSL.VERIFY_FAIL_IF_NO_PEER_CERT,
+@functools.lru_cache(maxsize=1)
+def _get_stdlib_to_openssl_verify():
+    """Map the stdlib verify modes onto the pyOpenSSL ones.
+
+    pyOpenSSL is only imported once a test exercises its adapter.
+    """
+    import OpenSSL.SSL
+
+    return {
+        ssl.CERT_NONE: OpenSSL.SSL.VERIFY_NONE,
+        ssl.CERT_OPTIONAL: OpenSSL.SSL.VERIFY_PEER,
+        ssl.CERT_REQUIRED: OpenSSL.SSL.VERIFY_PEER
+        + OpenSSL.SSL.VERIFY_FAIL_IF_NO_PEER_CERT,
+    }
+
+
+# Resolve each adapter class once instead of on every adapter built:
+_get_ssl_adapter_class = functools.lru_cache(maxsize=None)(
+    get_ssl_adapter_class,
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _is_pyopenssl_ssl_version_1_0():
+    """Check whether pyOpenSSL is linked against OpenSSL 1.0."""
+    import OpenSSL.SSL
+
+    return OpenSSL.SSL.SSLeay_version(
+        OpenSSL.SSL.SSLEAY_VERSION,
+    ).startswith(b"OpenSSL 1.0.")
+
+
+# Whether the client cert CA is trusted by the server and the cert identity:
+_tls_client_identities = (
+    (True, "localhost"),
+    (True, "127.0.0.1"),
+    (True, "*.localhost"),
+    (True, "not_localhost"),
+    (False, "localhost"),
+)
+
+
+# Expected errno and message of a connection reset by peer per platform:
+_conn_reset_errors = {
+    "Linux": (104, "Connection reset by peer"),
+    "Darwin": (54, "Connection reset by peer"),
+    "Windows": (
+        10054,
+        "An existing connection was forcibly closed by the remote host",
+    ),
 }
 
 
@@ -70,27 +102,25 @@ class HelloWorldGateway(Gateway_10):
     def respond(self):
         """Respond with dummy content via HTTP."""
         req = self.req
-        req_uri = bton(req.uri)
-        if req_uri == "/":
+        if req.uri == b"/":
             req.status = b"200 OK"
             req.ensure_headers_sent()
             req.write(b"Hello world!")
             return
-        if req_uri == "/env":
+        if req.uri == b"/env":
             req.status = b"200 OK"
             req.ensure_headers_sent()
             env = self.get_environ()
             # drop files so that it can be json dumped
             env.pop("wsgi.errors")
             env.pop("wsgi.input")
-            print(env)
             req.write(json.dumps(env).encode("utf-8"))
             return
         return super(HelloWorldGateway, self).respond()
 
 
-def make_tls_http_server(bind_addr, ssl_adapter, request):
-    """Create and start an HTTP server bound to ``bind_addr``."""
+def make_tls_http_server(bind_addr, ssl_adapter):
+    """Create an HTTP server bound to ``bind_addr``."""
     httpserver = HTTPServer(
         bind_addr=bind_addr,
         gateway=HelloWorldGateway,
@@ -98,54 +128,205 @@ def make_tls_http_server(bind_addr, ssl_adapter, request):
     # httpserver.gateway = HelloWorldGateway
     httpserver.ssl_adapter = ssl_adapter
 
-    threading.Thread(target=httpserver.safe_start).start()
-
-    while not httpserver.ready:
-        time.sleep(0.1)
-
-    request.addfinalizer(httpserver.stop)
-
     return httpserver
 
 
 @pytest.fixture
-def tls_http_server(request):
+def tls_http_server():
     """Provision a server creator as a fixture."""
-    return functools.partial(make_tls_http_server, request=request)
+    with server_starter(make_tls_http_server) as start_srv:
+        yield start_srv
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def shared_tls_http_server():
+    """Provision a caching server creator as a fixture.
+
+    The servers it starts are reused across the tests and are only stopped
+    at the end of the session.
+    """
+    with server_starter(make_tls_http_server) as start_srv:
+        yield functools.lru_cache(maxsize=None)(start_srv)
+
+
+@pytest.fixture(scope="session")
+def requests_session():
+    """Provide a shared plain HTTP client session via fixture.
+
+    Reusing one :py:class:`requests.Session` across the plain HTTP
+    error checks spares building a new transport adapter each time.
+    Client certificate tests must not use it: pooled connections are
+    only keyed by host and port, so they could skip the handshake.
+    """
+    with requests.Session() as session:
+        yield session
+
+
+@pytest.fixture(scope="session")
 def ca():
     """Provide a certificate authority via fixture."""
-    return trustme.CA()
+    return trustme.CA(key_type=trustme.KeyType.ECDSA)
 
 
-@pytest.fixture
-def tls_ca_certificate_pem_path(ca):
+@pytest.fixture(scope="session")
+def tls_pem_dir(tmp_path_factory):
+    """Provide a directory for the TLS PEM files via fixture."""
+    return tmp_path_factory.mktemp("tls", numbered=False)
+
+
+@pytest.fixture(scope="session")
+def tls_ca_certificate_pem_path(ca, tls_pem_dir):
     """Provide a certificate authority certificate file via fixture."""
-    with ca.cert_pem.tempfile() as ca_cert_pem:
-        yield ca_cert_pem
+    ca_cert_pem = tls_pem_dir / "ca.pem"
+    ca.cert_pem.write_to_path(ca_cert_pem)
+    return str(ca_cert_pem)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tls_certificate(ca):
     """Provide a leaf certificate via fixture."""
     interface, _host, _port = _get_conn_data(ANY_INTERFACE_IPV4)
-    return ca.issue_cert(ntou(interface))
+    return ca.issue_cert(ntou(interface), key_type=trustme.KeyType.ECDSA)
 
 
-@pytest.fixture
-def tls_certificate_chain_pem_path(tls_certificate):
+@pytest.fixture(scope="session")
+def tls_certificate_chain_pem_path(tls_certificate, tls_pem_dir):
     """Provide a certificate chain PEM file path via fixture."""
-    with tls_certificate.private_key_and_cert_chain_pem.tempfile() as cert_pem:
-        yield cert_pem
+    cert_pem = tls_pem_dir / "cert-chain.pem"
+    tls_certificate.private_key_and_cert_chain_pem.write_to_path(cert_pem)
+    return str(cert_pem)
 
 
-@pytest.fixture
-def tls_certificate_private_key_pem_path(tls_certificate):
+@pytest.fixture(scope="session")
+def tls_certificate_private_key_pem_path(tls_certificate, tls_pem_dir):
     """Provide a certificate private key PEM file path via fixture."""
-    with tls_certificate.private_key_pem.tempfile() as cert_key_pem:
-        yield cert_key_pem
+    cert_key_pem = tls_pem_dir / "cert-key.pem"
+    tls_certificate.private_key_pem.write_to_path(cert_key_pem)
+    return str(cert_key_pem)
+
+
+@pytest.fixture(scope="session")
+def tls_client_certificates(ca):
+    """Provide client certificates for all tested identities via fixture.
+
+    They are keyed by whether the issuing CA is trusted by the server and
+    the client identity.
+    """
+    untrusted_ca = trustme.CA(key_type=trustme.KeyType.ECDSA)
+
+    client_certs = {}
+    for is_trusted_cert, tls_client_identity in _tls_client_identities:
+        client_cert_root_ca = ca if is_trusted_cert else untrusted_ca
+        with pytest.MonkeyPatch.context() as monkeypatch:
+            monkeypatch.setattr(
+                "idna.core.ulabel",
+                lambda *_args, **_kwargs: ntob(tls_client_identity),
+            )
+            client_certs[is_trusted_cert, tls_client_identity] = (
+                client_cert_root_ca.issue_cert(
+                    ntou(tls_client_identity),
+                    key_type=trustme.KeyType.ECDSA,
+                )
+            )
+    return client_certs
+
+
+@pytest.fixture(scope="session")
+def tls_client_certificate_pem_paths(tls_client_certificates, tls_pem_dir):
+    """Provide client certificate and key files for all identities."""
+    client_cert_pem_paths = {}
+    for cert_num, (client_cert_key, client_cert) in enumerate(
+        tls_client_certificates.items(),
+    ):
+        client_cert_pem = tls_pem_dir / "client-{num}.pem".format(num=cert_num)
+        client_cert.private_key_and_cert_chain_pem.write_to_path(
+            client_cert_pem,
+        )
+        client_cert_pem_paths[client_cert_key] = str(client_cert_pem)
+    return client_cert_pem_paths
+
+
+@pytest.fixture(scope="session")
+def tls_client_context(tls_ca_certificate_pem_path):
+    """Provide a client TLS context trusting the test CA via fixture."""
+    return ssl.create_default_context(cafile=tls_ca_certificate_pem_path)
+
+
+@pytest.fixture(scope="session")
+def tls_client_context_with_cert(
+    tls_ca_certificate_pem_path,
+    tls_client_certificates,
+):
+    """Provide a client TLS context presenting a trusted client cert."""
+    tls_context = ssl.create_default_context(
+        cafile=tls_ca_certificate_pem_path,
+    )
+    tls_client_certificates[True, "127.0.0.1"].configure_cert(tls_context)
+    return tls_context
+
+
+@pytest.fixture(scope="session")
+def tls_client_cert_pem_text(tls_client_certificates):
+    """Provide the trusted client cert PEM text via fixture."""
+    client_cert = tls_client_certificates[True, "127.0.0.1"]
+    return client_cert.private_key_and_cert_chain_pem.bytes().decode("ascii")
+
+
+@pytest.fixture(scope="session")
+def tls_adapter_builder(
+    ca,
+    tls_certificate,
+    tls_certificate_chain_pem_path,
+    tls_certificate_private_key_pem_path,
+):
+    """Provide a TLS adapter constructor via fixture.
+
+    The verify mode is set before any server creates connections out
+    of the adapter context, as it can't be changed afterwards.
+    """
+
+    def make_tls_adapter(adapter_type, tls_verify_mode=None):
+        tls_adapter_cls = _get_ssl_adapter_class(name=adapter_type)
+        tls_adapter = tls_adapter_cls(
+            tls_certificate_chain_pem_path,
+            tls_certificate_private_key_pem_path,
+        )
+        if adapter_type == "pyopenssl":
+            tls_adapter.context = tls_adapter.get_context()
+
+        if tls_verify_mode is not None:
+            _set_tls_verify_mode(tls_adapter, tls_verify_mode)
+
+        ca.configure_trust(tls_adapter.context)
+        tls_certificate.configure_cert(tls_adapter.context)
+
+        return tls_adapter
+
+    return make_tls_adapter
+
+
+@pytest.fixture(scope="session")
+def tls_adapter_factory(tls_adapter_builder):
+    """Provide a caching TLS adapter constructor via fixture."""
+    return functools.lru_cache(maxsize=None)(tls_adapter_builder)
+
+
+@pytest.fixture
+def tls_adapter(tls_adapter_factory, adapter_type):
+    """Provide a shared TLS adapter of ``adapter_type`` via fixture."""
+    return tls_adapter_factory(adapter_type)
+
+
+def _set_tls_verify_mode(tls_adapter, tls_verify_mode):
+    """Make ``tls_adapter`` verify client certs as per ``tls_verify_mode``."""
+    if isinstance(tls_adapter.context, ssl.SSLContext):
+        tls_adapter.context.verify_mode = tls_verify_mode
+        return
+
+    tls_adapter.context.set_verify(
+        _get_stdlib_to_openssl_verify()[tls_verify_mode],
+        lambda conn, cert, errno, depth, preverify_ok: preverify_ok,
+    )
 
 
 def _thread_except_hook(exceptions, args):
@@ -168,6 +349,29 @@ def _thread_except_hook(exceptions, args):
     )
 
 
+def _https_get(host, port, path, tls_context, timeout):
+    """Return the status and the body of a GET request over HTTPS."""
+    conn = http.client.HTTPSConnection(
+        host,
+        port,
+        timeout=timeout,
+        context=tls_context,
+    )
+    try:
+        conn.request("GET", path)
+        resp = conn.getresponse()
+        return resp.status, resp.read()
+    finally:
+        conn.close()
+
+
+def _get_innermost_error(exc):
+    """Unwrap exceptions that carry their cause as the last argument."""
+    while exc.args and isinstance(exc.args[-1], BaseException):
+        exc = exc.args[-1]
+    return exc
+
+
 @pytest.fixture
 def thread_exceptions():
     """Provide a list of uncaught exceptions from threads via a fixture.
@@ -199,42 +403,99 @@ def thread_exceptions():
 )
 def test_ssl_adapters(
     http_request_timeout,
-    tls_http_server,
-    adapter_type,
-    tls_certificate,
-    tls_certificate_chain_pem_path,
-    tls_certificate_private_key_pem_path,
-    tls_ca_certificate_pem_path,
+    shared_tls_http_server,
+    tls_adapter,
+    tls_client_context,
 ):
     """Test ability to connect to server via HTTPS using adapters."""
     interface, _host, port = _get_conn_data(ANY_INTERFACE_IPV4)
-    tls_adapter_cls = get_ssl_adapter_class(name=adapter_type)
-    tls_adapter = tls_adapter_cls(
-        tls_certificate_chain_pem_path,
-        tls_certificate_private_key_pem_path,
-    )
-    if adapter_type == "pyopenssl":
-        tls_adapter.context = tls_adapter.get_context()
-
-    tls_certificate.configure_cert(tls_adapter.context)
-
-    tlshttpserver = tls_http_server((interface, port), tls_adapter)
+    tlshttpserver = shared_tls_http_server((interface, port), tls_adapter)
 
     # testclient = get_server_client(tlshttpserver)
     # testclient.get('/')
 
-    interface, _host, port = _get_conn_data(
-        tlshttpserver.bind_addr,
+    port = tlshttpserver.bind_addr[1]
+
+    status, body = _https_get(
+        interface,
+        port,
+        "/",
+        tls_client_context,
+        http_request_timeout,
     )
 
-    resp = requests.get(
-        "https://{host!s}:{port!s}/".format(host=interface, port=port),
-        timeout=http_request_timeout,
-        verify=tls_ca_certificate_pem_path,
+    assert status == 200
+    assert body == b"Hello world!"
+
+
+@functools.lru_cache(maxsize=None)
+def _get_expected_tls_err_substrings(
+    adapter_type,
+    tls_verify_mode,
+    is_trusted_cert,
+    tls_client_identity,
+):
+    """Return the error fragments that a rejected client cert may cause."""
+    expected_substrings = (
+        "sslv3 alert bad certificate"
+        if IS_LIBRESSL_BACKEND
+        else "tlsv1 alert unknown ca",
     )
+    if IS_MACOS and IS_PYPY and adapter_type == "pyopenssl":
+        expected_substrings = ("tlsv1 alert unknown ca",)
+    if (
+        tls_verify_mode
+        in (
+            ssl.CERT_REQUIRED,
+            ssl.CERT_OPTIONAL,
+        )
+        and not is_trusted_cert
+        and tls_client_identity == "localhost"
+    ):
+        expected_substrings += (
+            (
+                "bad handshake: " "SysCallError(10054, 'WSAECONNRESET')",
+                "('Connection aborted.', " "OSError(\"(10054, 'WSAECONNRESET')\"))",
+                "('Connection aborted.', "
+                "OSError(\"(10054, 'WSAECONNRESET')\",))",
+                "('Connection aborted.', " "error(\"(10054, 'WSAECONNRESET')\",))",
+                "('Connection aborted.', "
+                "ConnectionResetError(10054, "
+                "'An existing connection was forcibly closed "
+                "by the remote host', None, 10054, None))",
+                "('Connection aborted.', "
+                "error(10054, "
+                "'An existing connection was forcibly closed "
+                "by the remote host'))",
+            )
+            if IS_WINDOWS
+            else (
+                "('Connection aborted.', " "OSError(\"(104, 'ECONNRESET')\"))",
+                "('Connection aborted.', " "OSError(\"(104, 'ECONNRESET')\",))",
+                "('Connection aborted.', " "error(\"(104, 'ECONNRESET')\",))",
+                "('Connection aborted.', "
+                "ConnectionResetError(104, 'Connection reset by peer'))",
+                "('Connection aborted.', "
+                "error(104, 'Connection reset by peer'))",
+            )
+            if (IS_GITHUB_ACTIONS_WORKFLOW and IS_LINUX)
+            else ("('Connection aborted.', " "BrokenPipeError(32, 'Broken pipe'))",)
+        )
+
+    if PY310_PLUS:
+        # FIXME: Figure out what's happening and correct the problem
+        expected_substrings += (
+            "SSLError(SSLEOFError(8, "
+            "'EOF occurred in violation of protocol (_ssl.c:",
+        )
+    if IS_GITHUB_ACTIONS_WORKFLOW and IS_WINDOWS and PY310_PLUS:
+        expected_substrings += (
+            "('Connection aborted.', "
+            "RemoteDisconnected("
+            "'Remote end closed connection without response'))",
+        )
 
-    assert resp.status_code == 200
-    assert resp.text == "Hello world!"
+    return expected_substrings
 
 
 @pytest.mark.parametrize(  # noqa: C901  # FIXME
@@ -245,21 +506,22 @@ def test_ssl_adapters(
     ),
 )
 @pytest.mark.parametrize(
-    ("is_trusted_cert", "tls_client_identity"),
-    (
-        (True, "localhost"),
-        (True, "127.0.0.1"),
-        (True, "*.localhost"),
-        (True, "not_localhost"),
-        (False, "localhost"),
-    ),
-)
-@pytest.mark.parametrize(
-    "tls_verify_mode",
-    (
-        ssl.CERT_NONE,  # server shouldn't validate client cert
-        ssl.CERT_OPTIONAL,  # same as CERT_REQUIRED in client mode, don't use
-        ssl.CERT_REQUIRED,  # server should validate if client cert CA is OK
+    ("is_trusted_cert", "tls_client_identity", "tls_verify_mode"),
+    tuple(
+        (is_trusted_cert, tls_client_identity, tls_verify_mode)
+        for tls_verify_mode in (
+            # server shouldn't validate client cert:
+            ssl.CERT_NONE,
+            # same as CERT_REQUIRED in client mode, don't use:
+            ssl.CERT_OPTIONAL,
+            # server should validate if client cert CA is OK:
+            ssl.CERT_REQUIRED,
+        )
+        for is_trusted_cert, tls_client_identity in _tls_client_identities
+        # NOTE: The server doesn't check the client cert identity under
+        # NOTE: CERT_NONE so testing just the 'localhost' one is enough.
+        if tls_verify_mode != ssl.CERT_NONE
+        or tls_client_identity == "localhost"
     ),
 )
 @pytest.mark.xfail(
@@ -270,13 +532,10 @@ def test_ssl_adapters(
 def test_tls_client_auth(  # noqa: C901, WPS213  # FIXME
     # FIXME: remove twisted logic, separate tests
     http_request_timeout,
-    mocker,
-    tls_http_server,
+    shared_tls_http_server,
     adapter_type,
-    ca,
-    tls_certificate,
-    tls_certificate_chain_pem_path,
-    tls_certificate_private_key_pem_path,
+    tls_adapter_factory,
+    tls_client_certificate_pem_paths,
     tls_ca_certificate_pem_path,
     is_trusted_cert,
     tls_client_identity,
@@ -286,153 +545,81 @@ def test_tls_client_auth(  # noqa: C901, WPS213  # FIXME
     test_cert_rejection = tls_verify_mode != ssl.CERT_NONE and not is_trusted_cert
     interface, _host, port = _get_conn_data(ANY_INTERFACE_IPV4)
 
-    client_cert_root_ca = ca if is_trusted_cert else trustme.CA()
-    with mocker.mock_module.patch(
-        "idna.core.ulabel",
-        return_value=ntob(tls_client_identity),
-    ):
-        client_cert = client_cert_root_ca.issue_cert(
-            ntou(tls_client_identity),
-        )
-        del client_cert_root_ca
-
-    with client_cert.private_key_and_cert_chain_pem.tempfile() as cl_pem:
-        tls_adapter_cls = get_ssl_adapter_class(name=adapter_type)
-        tls_adapter = tls_adapter_cls(
-            tls_certificate_chain_pem_path,
-            tls_certificate_private_key_pem_path,
-        )
-        if adapter_type == "pyopenssl":
-            tls_adapter.context = tls_adapter.get_context()
-            tls_adapter.context.set_verify(
-                _stdlib_to_openssl_verify[tls_verify_mode],
-                lambda conn, cert, errno, depth, preverify_ok: preverify_ok,
-            )
-        else:
-            tls_adapter.context.verify_mode = tls_verify_mode
+    client_cert_pem_path = tls_client_certificate_pem_paths[
+        is_trusted_cert,
+        tls_client_identity,
+    ]
 
-        ca.configure_trust(tls_adapter.context)
-        tls_certificate.configure_cert(tls_adapter.context)
-
-        tlshttpserver = tls_http_server((interface, port), tls_adapter)
+    tls_adapter = tls_adapter_factory(adapter_type, tls_verify_mode)
+    tlshttpserver = shared_tls_http_server((interface, port), tls_adapter)
 
-        interface, _host, port = _get_conn_data(tlshttpserver.bind_addr)
+    port = tlshttpserver.bind_addr[1]
 
-        make_https_request = functools.partial(
-            requests.get,
+    def make_https_request():
+        # NOTE: The server is shared and the client cert differs between
+        # NOTE: tests, so each request gets a throwaway session and thus a
+        # NOTE: new handshake instead of a pooled keep-alive connection.
+        return requests.get(
             "https://{host!s}:{port!s}/".format(host=interface, port=port),
             # Don't wait for the first byte forever:
             timeout=http_request_timeout,
             # Server TLS certificate verification:
             verify=tls_ca_certificate_pem_path,
             # Client TLS certificate verification:
-            cert=cl_pem,
+            cert=client_cert_pem_path,
         )
 
-        if not test_cert_rejection:
-            resp = make_https_request()
-            is_req_successful = resp.status_code == 200
-            if (
-                not is_req_successful
-                and IS_PYOPENSSL_SSL_VERSION_1_0
-                and adapter_type == "builtin"
-                and tls_verify_mode == ssl.CERT_REQUIRED
-                and tls_client_identity == "localhost"
-                and is_trusted_cert
-            ):
-                pytest.xfail(
-                    "OpenSSL 1.0 has problems with verifying client certs",
-                )
-            assert is_req_successful
-            assert resp.text == "Hello world!"
-            resp.close()
-            return
-
-        # xfail some flaky tests
-        # https://github.com/cherrypy/cheroot/issues/237
-        issue_237 = (
-            IS_MACOS and adapter_type == "builtin" and tls_verify_mode != ssl.CERT_NONE
-        )
-        if issue_237:
-            pytest.xfail("Test sometimes fails")
-
-        expected_ssl_errors = (requests.exceptions.SSLError,)
-        if IS_WINDOWS or IS_GITHUB_ACTIONS_WORKFLOW:
-            expected_ssl_errors += (requests.exceptions.ConnectionError,)
-        with pytest.raises(expected_ssl_errors) as ssl_err:
-            make_https_request().close()
-
-        try:
-            err_text = ssl_err.value.args[0].reason.args[0].args[0]
-        except AttributeError:
-            if IS_WINDOWS or IS_GITHUB_ACTIONS_WORKFLOW:
-                err_text = str(ssl_err.value)
-            else:
-                raise
-
-        if isinstance(err_text, int):
-            err_text = str(ssl_err.value)
-
-        expected_substrings = (
-            "sslv3 alert bad certificate"
-            if IS_LIBRESSL_BACKEND
-            else "tlsv1 alert unknown ca",
-        )
-        if IS_MACOS and IS_PYPY and adapter_type == "pyopenssl":
-            expected_substrings = ("tlsv1 alert unknown ca",)
+    if not test_cert_rejection:
+        resp = make_https_request()
+        is_req_successful = resp.status_code == 200
         if (
-            tls_verify_mode
-            in (
-                ssl.CERT_REQUIRED,
-                ssl.CERT_OPTIONAL,
-            )
-            and not is_trusted_cert
+            not is_req_successful
+            and adapter_type == "builtin"
+            and tls_verify_mode == ssl.CERT_REQUIRED
             and tls_client_identity == "localhost"
+            and is_trusted_cert
+            and _is_pyopenssl_ssl_version_1_0()
         ):
-            expected_substrings += (
-                (
-                    "bad handshake: " "SysCallError(10054, 'WSAECONNRESET')",
-                    "('Connection aborted.', " "OSError(\"(10054, 'WSAECONNRESET')\"))",
-                    "('Connection aborted.', "
-                    "OSError(\"(10054, 'WSAECONNRESET')\",))",
-                    "('Connection aborted.', " "error(\"(10054, 'WSAECONNRESET')\",))",
-                    "('Connection aborted.', "
-                    "ConnectionResetError(10054, "
-                    "'An existing connection was forcibly closed "
-                    "by the remote host', None, 10054, None))",
-                    "('Connection aborted.', "
-                    "error(10054, "
-                    "'An existing connection was forcibly closed "
-                    "by the remote host'))",
-                )
-                if IS_WINDOWS
-                else (
-                    "('Connection aborted.', " "OSError(\"(104, 'ECONNRESET')\"))",
-                    "('Connection aborted.', " "OSError(\"(104, 'ECONNRESET')\",))",
-                    "('Connection aborted.', " "error(\"(104, 'ECONNRESET')\",))",
-                    "('Connection aborted.', "
-                    "ConnectionResetError(104, 'Connection reset by peer'))",
-                    "('Connection aborted.', "
-                    "error(104, 'Connection reset by peer'))",
-                )
-                if (IS_GITHUB_ACTIONS_WORKFLOW and IS_LINUX)
-                else ("('Connection aborted.', " "BrokenPipeError(32, 'Broken pipe'))",)
+            pytest.xfail(
+                "OpenSSL 1.0 has problems with verifying client certs",
             )
+        assert is_req_successful
+        assert resp.text == "Hello world!"
+        resp.close()
+        return
 
-        if PY310_PLUS:
-            # FIXME: Figure out what's happening and correct the problem
-            expected_substrings += (
-                "SSLError(SSLEOFError(8, "
-                "'EOF occurred in violation of protocol (_ssl.c:",
-            )
-        if IS_GITHUB_ACTIONS_WORKFLOW and IS_WINDOWS and PY310_PLUS:
-            expected_substrings += (
-                "('Connection aborted.', "
-                "RemoteDisconnected("
-                "'Remote end closed connection without response'))",
-            )
+    # xfail some flaky tests
+    # https://github.com/cherrypy/cheroot/issues/237
+    issue_237 = (
+        IS_MACOS and adapter_type == "builtin" and tls_verify_mode != ssl.CERT_NONE
+    )
+    if issue_237:
+        pytest.xfail("Test sometimes fails")
+
+    expected_ssl_errors = (requests.exceptions.SSLError,)
+    if IS_WINDOWS or IS_GITHUB_ACTIONS_WORKFLOW:
+        expected_ssl_errors += (requests.exceptions.ConnectionError,)
+    with pytest.raises(expected_ssl_errors) as ssl_err:
+        make_https_request().close()
+
+    try:
+        err_text = ssl_err.value.args[0].reason.args[0].args[0]
+    except AttributeError:
+        if IS_WINDOWS or IS_GITHUB_ACTIONS_WORKFLOW:
+            err_text = str(ssl_err.value)
+        else:
+            raise
 
-        assert any(e in err_text for e in expected_substrings)
+    if isinstance(err_text, int):
+        err_text = str(ssl_err.value)
+
+    expected_substrings = _get_expected_tls_err_substrings(
+        adapter_type,
+        tls_verify_mode,
+        is_trusted_cert,
+        tls_client_identity,
+    )
+    assert any(e in err_text for e in expected_substrings)
 
 
 @pytest.mark.parametrize(  # noqa: C901  # FIXME
@@ -451,102 +638,80 @@ def test_tls_client_auth(  # noqa: C901, WPS213  # FIXME
     ),
 )
 @pytest.mark.parametrize(
-    ("tls_verify_mode", "use_client_cert"),
+    ("tls_verify_mode", "use_client_cert", "expected_client_verify"),
     (
-        (ssl.CERT_NONE, False),
-        (ssl.CERT_NONE, True),
-        (ssl.CERT_OPTIONAL, False),
-        (ssl.CERT_OPTIONAL, True),
-        (ssl.CERT_REQUIRED, True),
+        (ssl.CERT_NONE, False, "NONE"),
+        (ssl.CERT_NONE, True, "NONE"),
+        (ssl.CERT_OPTIONAL, False, "NONE"),
+        (ssl.CERT_OPTIONAL, True, "SUCCESS"),
+        (ssl.CERT_REQUIRED, True, "SUCCESS"),
     ),
 )
 def test_ssl_env(  # noqa: C901  # FIXME
     thread_exceptions,
     recwarn,
-    mocker,
     http_request_timeout,
     tls_http_server,
     adapter_type,
-    ca,
+    tls_adapter_builder,
+    tls_client_context,
+    tls_client_context_with_cert,
+    tls_client_cert_pem_text,
     tls_verify_mode,
-    tls_certificate,
-    tls_certificate_chain_pem_path,
-    tls_certificate_private_key_pem_path,
-    tls_ca_certificate_pem_path,
     use_client_cert,
+    expected_client_verify,
 ):
     """Test the SSL environment generated by the SSL adapters."""
     interface, _host, port = _get_conn_data(ANY_INTERFACE_IPV4)
 
-    with mocker.mock_module.patch(
-        "idna.core.ulabel",
-        return_value=ntob("127.0.0.1"),
-    ):
-        client_cert = ca.issue_cert(ntou("127.0.0.1"))
+    tls_adapter = tls_adapter_builder(adapter_type, tls_verify_mode)
+    tlswsgiserver = tls_http_server((interface, port), tls_adapter)
 
-    with client_cert.private_key_and_cert_chain_pem.tempfile() as cl_pem:
-        tls_adapter_cls = get_ssl_adapter_class(name=adapter_type)
-        tls_adapter = tls_adapter_cls(
-            tls_certificate_chain_pem_path,
-            tls_certificate_private_key_pem_path,
-        )
-        if adapter_type == "pyopenssl":
-            tls_adapter.context = tls_adapter.get_context()
-            tls_adapter.context.set_verify(
-                _stdlib_to_openssl_verify[tls_verify_mode],
-                lambda conn, cert, errno, depth, preverify_ok: preverify_ok,
-            )
-        else:
-            tls_adapter.context.verify_mode = tls_verify_mode
+    port = tlswsgiserver.bind_addr[1]
 
-        ca.configure_trust(tls_adapter.context)
-        tls_certificate.configure_cert(tls_adapter.context)
+    _status, body = _https_get(
+        interface,
+        port,
+        "/env",
+        (
+            tls_client_context_with_cert
+            if use_client_cert
+            else tls_client_context
+        ),
+        http_request_timeout,
+    )
 
-        tlswsgiserver = tls_http_server((interface, port), tls_adapter)
+    env = json.loads(body.decode("utf-8"))
 
-        interface, _host, port = _get_conn_data(tlswsgiserver.bind_addr)
+    # hard coded env
+    assert env["wsgi.url_scheme"] == "https"
+    assert env["HTTPS"] == "on"
 
-        resp = requests.get(
-            "https://" + interface + ":" + str(port) + "/env",
-            timeout=http_request_timeout,
-            verify=tls_ca_certificate_pem_path,
-            cert=cl_pem if use_client_cert else None,
-        )
+    # ensure these are present
+    for key in {"SSL_VERSION_INTERFACE", "SSL_VERSION_LIBRARY"}:
+        assert key in env
 
-        env = json.loads(resp.content.decode("utf-8"))
+    # pyOpenSSL generates the env before the handshake completes
+    if adapter_type == "pyopenssl":
+        return
 
-        # hard coded env
-        assert env["wsgi.url_scheme"] == "https"
-        assert env["HTTPS"] == "on"
+    for key in {"SSL_PROTOCOL", "SSL_CIPHER"}:
+        assert key in env
 
-        # ensure these are present
-        for key in {"SSL_VERSION_INTERFACE", "SSL_VERSION_LIBRARY"}:
-            assert key in env
+    # client certificate env
+    assert env["SSL_CLIENT_VERIFY"] == expected_client_verify
 
-        # pyOpenSSL generates the env before the handshake completes
-        if adapter_type == "pyopenssl":
-            return
+    if expected_client_verify == "SUCCESS":
+        assert env["SSL_CLIENT_CERT"] in tls_client_cert_pem_text
 
-        for key in {"SSL_PROTOCOL", "SSL_CIPHER"}:
+        for key in {
+            "SSL_CLIENT_M_VERSION",
+            "SSL_CLIENT_M_SERIAL",
+            "SSL_CLIENT_I_DN",
+            "SSL_CLIENT_S_DN",
+        }:
             assert key in env
 
-        # client certificate env
-        if tls_verify_mode == ssl.CERT_NONE or not use_client_cert:
-            assert env["SSL_CLIENT_VERIFY"] == "NONE"
-        else:
-            assert env["SSL_CLIENT_VERIFY"] == "SUCCESS"
-
-            with open(cl_pem, "rt") as f:
-                assert env["SSL_CLIENT_CERT"] in f.read()
-
-            for key in {
-                "SSL_CLIENT_M_VERSION",
-                "SSL_CLIENT_M_SERIAL",
-                "SSL_CLIENT_I_DN",
-                "SSL_CLIENT_S_DN",
-            }:
-                assert key in env
-
     # builtin ssl environment generation may use a loopback socket
     # ensure no ResourceWarning was raised during the test
     if IS_PYPY:
@@ -595,7 +760,7 @@ def test_ssl_env(  # noqa: C901  # FIXME
 )
 def test_https_over_http_error(http_server, ip_addr):
     """Ensure that connecting over HTTPS to HTTP port is handled."""
-    httpserver = http_server.send((ip_addr, EPHEMERAL_PORT))
+    httpserver = http_server((ip_addr, EPHEMERAL_PORT))
     interface, _host, port = _get_conn_data(httpserver.bind_addr)
     with pytest.raises(ssl.SSLError) as ssl_err:
         http.client.HTTPSConnection(
@@ -627,13 +792,11 @@ def test_https_over_http_error(http_server, ip_addr):
 @pytest.mark.flaky(reruns=3, reruns_delay=2)
 def test_http_over_https_error(
     http_request_timeout,
+    requests_session,
     tls_http_server,
     adapter_type,
-    ca,
+    tls_adapter,
     ip_addr,
-    tls_certificate,
-    tls_certificate_chain_pem_path,
-    tls_certificate_private_key_pem_path,
 ):
     """Ensure that connecting over HTTP to HTTPS port is handled."""
     # disable some flaky tests
@@ -642,22 +805,10 @@ def test_http_over_https_error(
     if issue_225:
         pytest.xfail("Test fails in Travis-CI")
 
-    tls_adapter_cls = get_ssl_adapter_class(name=adapter_type)
-    tls_adapter = tls_adapter_cls(
-        tls_certificate_chain_pem_path,
-        tls_certificate_private_key_pem_path,
-    )
-    if adapter_type == "pyopenssl":
-        tls_adapter.context = tls_adapter.get_context()
-
-    tls_certificate.configure_cert(tls_adapter.context)
-
     interface, _host, port = _get_conn_data(ip_addr)
     tlshttpserver = tls_http_server((interface, port), tls_adapter)
 
-    interface, _host, port = _get_conn_data(
-        tlshttpserver.bind_addr,
-    )
+    port = tlshttpserver.bind_addr[1]
 
     fqdn = interface
     if ip_addr is ANY_INTERFACE_IPV6:
@@ -665,7 +816,7 @@ def test_http_over_https_error(
 
     expect_fallback_response_over_plain_http = adapter_type == "pyopenssl"
     if expect_fallback_response_over_plain_http:
-        resp = requests.get(
+        resp = requests_session.get(
             "http://{host!s}:{port!s}/".format(host=fqdn, port=port),
             timeout=http_request_timeout,
         )
@@ -677,28 +828,14 @@ def test_http_over_https_error(
         return
 
     with pytest.raises(requests.exceptions.ConnectionError) as ssl_err:
-        requests.get(  # FIXME: make stdlib ssl behave like PyOpenSSL
+        requests_session.get(  # FIXME: make stdlib ssl behave like PyOpenSSL
             "http://{host!s}:{port!s}/".format(host=fqdn, port=port),
             timeout=http_request_timeout,
         )
 
-    if IS_LINUX:
-        expected_error_code, expected_error_text = (
-            104,
-            "Connection reset by peer",
-        )
-    if IS_MACOS:
-        expected_error_code, expected_error_text = (
-            54,
-            "Connection reset by peer",
-        )
-    if IS_WINDOWS:
-        expected_error_code, expected_error_text = (
-            10054,
-            "An existing connection was forcibly closed by the remote host",
-        )
+    expected_error_code, expected_error_text = _conn_reset_errors[SYS_PLATFORM]
 
-    underlying_error = ssl_err.value.args[0].args[-1]
+    underlying_error = _get_innermost_error(ssl_err.value)
     err_text = str(underlying_error)
     assert (
         underlying_error.errno == expected_error_code
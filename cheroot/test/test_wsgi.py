@@ -4,13 +4,13 @@ from concurrent.futures.thread import ThreadPoolExecutor
 from traceback import print_tb
 
 import pytest
-import portend
 import requests
 from requests_toolbelt.sessions import BaseUrlSession as Session
 from jaraco.context import ExceptionTrap
 
 from cheroot import wsgi
 from cheroot._compat import IS_MACOS, IS_WINDOWS
+from ..testing import EPHEMERAL_PORT
 
 
 IS_SLOW_ENV = IS_MACOS or IS_WINDOWS
@@ -19,7 +19,6 @@ IS_SLOW_ENV = IS_MACOS or IS_WINDOWS
 @pytest.fixture
 def simple_wsgi_server():
     """Fucking simple wsgi server fixture (duh)."""
-    port = portend.find_available_local_port()
 
     def app(_environ, start_response):
         status = "200 OK"
@@ -28,12 +27,13 @@ def simple_wsgi_server():
         return [b"Hello world!"]
 
     host = "::"
-    addr = host, port
+    addr = host, EPHEMERAL_PORT
     server = wsgi.Server(addr, app, timeout=600 if IS_SLOW_ENV else 20)
     # pylint: disable=possibly-unused-variable
-    url = "http://localhost:{port}/".format(**locals())
-    # pylint: disable=possibly-unused-variable
     with server._run_in_thread() as thread:
+        port = server.bind_addr[1]
+        # pylint: disable=possibly-unused-variable
+        url = "http://localhost:{port}/".format(**locals())
         yield locals()
 
 
@@ -51,7 +51,8 @@ def test_connection_keepalive(simple_wsgi_server):
         with ExceptionTrap(requests.exceptions.ConnectionError) as trap:
             resp = session.get("info")
             resp.raise_for_status()
-        print_tb(trap.tb)
+        if trap:
+            print_tb(trap.tb)
         return bool(trap)
 
     with ThreadPoolExecutor(max_workers=10 if IS_SLOW_ENV else 50) as pool:
@@ -1,10 +1,9 @@
 """Pytest fixtures and other helpers for doing testing by end-users."""
 
-from contextlib import closing, contextmanager
+from contextlib import ExitStack, closing, contextmanager
 import errno
+import functools
 import socket
-import threading
-import time
 import http.client
 
 import pytest
@@ -36,31 +35,34 @@ def cheroot_server(server_factory):  # noqa: WPS210
     conf = config[server_factory].copy()
     bind_port = conf.pop("bind_addr")[-1]
 
+    server_runner = ExitStack()
     for interface in ANY_INTERFACE_IPV6, ANY_INTERFACE_IPV4:
+        actual_bind_addr = (interface, bind_port)
+        httpserver = server_factory(  # create it
+            bind_addr=actual_bind_addr,
+            **conf,
+        )
+        httpserver.shutdown_timeout = 0  # Speed-up tests teardown
         try:
-            actual_bind_addr = (interface, bind_port)
-            httpserver = server_factory(  # create it
-                bind_addr=actual_bind_addr,
-                **conf,
+            # NOTE: Constructing a server never binds, so it's the
+            # NOTE: failing prepare() that tells us to fall back to IPv4.
+            server_thread = server_runner.enter_context(
+                httpserver._run_in_thread(),  # spawn it
             )
         except OSError:
-            pass
+            # Release whatever the failed attempt managed to acquire
+            abandoned_sock = getattr(httpserver, "socket", None)
+            if abandoned_sock is not None:
+                abandoned_sock.close()
+            if interface == ANY_INTERFACE_IPV4:
+                raise
         else:
             break
 
-    httpserver.shutdown_timeout = 0  # Speed-up tests teardown
-
-    # FIXME: Expose this thread through a fixture so that it
-    # FIXME: could be awaited in tests.
-    server_thread = threading.Thread(target=httpserver.safe_start)
-    server_thread.start()  # spawn it
-    while not httpserver.ready:  # wait until fully initialized and bound
-        time.sleep(0.1)
-
     try:
         yield server_thread, httpserver
     finally:
-        httpserver.stop()  # destroy it
+        server_runner.close()  # destroy it
         server_thread.join()  # wait for the thread to be turn down
 
 
@@ -118,6 +120,10 @@ class _TestClient:
         )
         return conn_cls(name)
 
+    def close(self):
+        """Close the client's persistent HTTP connection."""
+        self._http_connection.close()
+
     def request(
         self,
         uri,
@@ -136,17 +142,42 @@ class _TestClient:
             protocol=protocol,
         )
 
+    # NOTE: Common verbs are real methods so that calling them doesn't
+    # NOTE: go through ``__getattr__`` and build a new closure each time.
+    get = functools.partialmethod(request, method="GET")
+    head = functools.partialmethod(request, method="HEAD")
+    post = functools.partialmethod(request, method="POST")
+    put = functools.partialmethod(request, method="PUT")
+    patch = functools.partialmethod(request, method="PATCH")
+    delete = functools.partialmethod(request, method="DELETE")
+    options = functools.partialmethod(request, method="OPTIONS")
+    connect = functools.partialmethod(request, method="CONNECT")
+
     def __getattr__(self, attr_name):
+        if attr_name.startswith("_"):
+            raise AttributeError(
+                "'%s' object has no attribute '%s'"
+                % (type(self).__name__, attr_name),
+            )
+
         def _wrapper(uri, **kwargs):
             http_method = attr_name.upper()
             return self.request(uri, method=http_method, **kwargs)
 
+        # Cache the wrapper so that later lookups skip ``__getattr__``
+        setattr(self, attr_name, _wrapper)
         return _wrapper
 
 
+@functools.lru_cache(maxsize=None)
 def _probe_ipv6_sock(interface):
+    # NOTE: Interface availability doesn't change while the process runs,
+    # NOTE: so only probe each one once.
     # Alternate way is to check IPs on interfaces using glibc, like:
     # github.com/Gautier/minifail/blob/master/minifail/getifaddrs.py
+    if not socket.has_ipv6:  # Python built without IPv6 support
+        return False
+
     try:
         with closing(socket.socket(family=socket.AF_INET6)) as sock:
             sock.bind((interface, 0))